@@ -27,6 +27,32 @@ import logging
 log = logging.getLogger(__name__)
 
 
+_DEFAULT_VM_SETTINGS = {"vmname": "",
+                        "usage": "",
+                        "adapters": VBOX_VM_SETTINGS["adapters"],
+                        "use_any_adapter": VBOX_VM_SETTINGS["use_any_adapter"],
+                        "adapter_type": VBOX_VM_SETTINGS["adapter_type"],
+                        "ram": VBOX_VM_SETTINGS["ram"],
+                        "headless": VBOX_VM_SETTINGS["headless"],
+                        "on_close": VBOX_VM_SETTINGS["on_close"],
+                        "console_type": VBOX_VM_SETTINGS["console_type"],
+                        "console_auto_start": VBOX_VM_SETTINGS["console_auto_start"],
+                        "custom_adapters": VBOX_VM_SETTINGS["custom_adapters"],
+                        "port_name_format": "Ethernet0",
+                        "port_segment_size": 0,
+                        "first_port_name": None}
+
+_INFO_FORMAT = """VirtualBox VM {name} is {state}
+  Running on server {host} with port {port}
+  Local ID is {id} and server ID is {node_id}
+  VirtualBox's name is "{vmname}"
+  Amount of memory is {ram}MB
+  Console is on port {console} and type is {console_type}
+"""
+_PORT_EMPTY_FORMAT = "     {} is empty\n"
+_PORT_DESCRIPTION_FORMAT = "     {} {}\n"
+
+
 class VirtualBoxVM(Node):
     """
     VirtualBox VM.
@@ -37,28 +63,14 @@ class VirtualBoxVM(Node):
     """
 
     URL_PREFIX = "virtualbox"
+    _config_page_cls = None
 
     def __init__(self, module, server, project):
 
         super().__init__(module, server, project)
         self._linked_clone = False
 
-        virtualbox_vm_settings = {"vmname": "",
-                                  "usage": "",
-                                  "adapters": VBOX_VM_SETTINGS["adapters"],
-                                  "use_any_adapter": VBOX_VM_SETTINGS["use_any_adapter"],
-                                  "adapter_type": VBOX_VM_SETTINGS["adapter_type"],
-                                  "ram": VBOX_VM_SETTINGS["ram"],
-                                  "headless": VBOX_VM_SETTINGS["headless"],
-                                  "on_close": VBOX_VM_SETTINGS["on_close"],
-                                  "console_type": VBOX_VM_SETTINGS["console_type"],
-                                  "console_auto_start": VBOX_VM_SETTINGS["console_auto_start"],
-                                  "custom_adapters": VBOX_VM_SETTINGS["custom_adapters"],
-                                  "port_name_format": "Ethernet0",
-                                  "port_segment_size": 0,
-                                  "first_port_name": None}
-
-        self.settings().update(virtualbox_vm_settings)
+        self.settings().update(_DEFAULT_VM_SETTINGS)
 
     def info(self):
         """
@@ -67,32 +79,25 @@ class VirtualBoxVM(Node):
         :returns: formatted string
         """
 
-        info = """VirtualBox VM {name} is {state}
-  Running on server {host} with port {port}
-  Local ID is {id} and server ID is {node_id}
-  VirtualBox's name is "{vmname}"
-  Amount of memory is {ram}MB
-  Console is on port {console} and type is {console_type}
-""".format(name=self.name(),
-           id=self.id(),
-           node_id=self._node_id,
-           state=self.state(),
-           vmname=self._settings["vmname"],
-           ram=self._settings["ram"],
-           host=self.compute().name(),
-           port=self.compute().port(),
-           console=self._settings["console"],
-           console_type=self._settings["console_type"])
-
-        port_info = ""
-        for port in self._ports:
-            if port.isFree():
-                port_info += "     {port_name} is empty\n".format(port_name=port.name())
-            else:
-                port_info += "     {port_name} {port_description}\n".format(port_name=port.name(),
-                                                                            port_description=port.description())
-
-        usage = "\n" + self._settings.get("usage")
+        settings = self._settings
+        compute = self.compute()
+        info = _INFO_FORMAT.format(name=self.name(),
+                                   id=self.id(),
+                                   node_id=self._node_id,
+                                   state=self.state(),
+                                   vmname=settings["vmname"],
+                                   ram=settings["ram"],
+                                   host=compute.name(),
+                                   port=compute.port(),
+                                   console=settings["console"],
+                                   console_type=settings["console_type"])
+
+        port_info = "".join(_PORT_EMPTY_FORMAT.format(port.name())
+                            if port.isFree() else
+                            _PORT_DESCRIPTION_FORMAT.format(port.name(), port.description())
+                            for port in self._ports)
+
+        usage = "\n" + settings.get("usage")
         return info + port_info + usage
 
     def bringToFront(self):
@@ -102,8 +107,9 @@ class VirtualBoxVM(Node):
 
         if self.status() == Node.started:
             # try 2 different window title formats
-            bring_window_to_front_from_process_name("VirtualBox.exe", title="{} [".format(self._settings["vmname"]))
-            bring_window_to_front_from_process_name("VirtualBox.exe", title="{} (".format(self._settings["vmname"]))
+            vmname = self._settings["vmname"]
+            bring_window_to_front_from_process_name("VirtualBox.exe", title="{} [".format(vmname))
+            bring_window_to_front_from_process_name("VirtualBox.exe", title="{} (".format(vmname))
 
         # bring any console to front
         return Node.bringToFront(self)
@@ -115,8 +121,10 @@ class VirtualBoxVM(Node):
         :returns: QWidget object
         """
 
-        from .pages.virtualbox_vm_configuration_page import VirtualBoxVMConfigurationPage
-        return VirtualBoxVMConfigurationPage
+        if VirtualBoxVM._config_page_cls is None:
+            from .pages.virtualbox_vm_configuration_page import VirtualBoxVMConfigurationPage
+            VirtualBoxVM._config_page_cls = VirtualBoxVMConfigurationPage
+        return VirtualBoxVM._config_page_cls
 
     @staticmethod
     def defaultSymbol():
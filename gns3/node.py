@@ -348,10 +348,14 @@ class Node(BaseNode):
         :param force: force this node to update
         """
 
+        if not new_settings and not force:
+            return
+
+        settings = self._settings
         params = {}
         for name, value in new_settings.items():
-            if name in self._settings:
-                if self._settings[name] != value:
+            if name in settings:
+                if settings[name] != value:
                     params[name] = value
             else:
                 log.warning("'{}' setting is unknown".format(name))
@@ -411,7 +415,7 @@ class Node(BaseNode):
         Update the node on the controller.
         """
 
-        log.debug("{} is updating settings: {}".format(self.name(), params))
+        log.debug("%s is updating settings: %s", self.name(), params)
         body = self._prepareBodyForUpdate(params)
         self.controllerHttpPut("/nodes/{node_id}".format(node_id=self._node_id), self._updateOnControllerCallback, body=body, timeout=timeout, showProgress=False)
 
@@ -528,11 +532,13 @@ class Node(BaseNode):
         if "ports" in result:
             self._updatePorts(result["ports"])
 
+        settings = self._settings
         if "properties" in result:
             for name, value in result["properties"].items():
-                if name in self._settings and self._settings[name] != value:
-                    log.debug("{} setting up and updating {} from '{}' to '{}'".format(self.name(), name, self._settings[name], value))
-                    self._settings[name] = value
+                if name in settings and settings[name] != value:
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("%s setting up and updating %s from '%s' to '%s'", self.name(), name, settings[name], value)
+                    settings[name] = value
 
             result.update(result["properties"])
             del result["properties"]
@@ -540,7 +546,7 @@ class Node(BaseNode):
         # Update common element of all nodes
         for key in ["x", "y", "z", "locked", "symbol", "label", "console_host", "console", "console_type", "console_auto_start", "custom_adapters"]:
             if key in result:
-                self._settings[key] = result[key]
+                settings[key] = result[key]
 
         return result
 
@@ -552,32 +558,40 @@ class Node(BaseNode):
         """
 
         self._settings["ports"] = ports
-        old_ports = self._ports.copy()
-        self._ports = []
-        for port in ports:
-            new_port = None
-
-            # Update port if it already exists
-            for old_port in old_ports:
-                if old_port.adapterNumber() == port["adapter_number"] and old_port.portNumber() == port["port_number"]:
-                    new_port = old_port
-                    old_port.setName(port["name"])
-                    old_ports.remove(old_port)
-                    break
-
-            if new_port is None:
-                if port["link_type"] == "serial":
-                    new_port = SerialPort(port["name"])
-                else:
-                    new_port = EthernetPort(port["name"])
-            new_port.setShortName(port["short_name"])
-            new_port.setAdapterNumber(port["adapter_number"])
-            new_port.setPortNumber(port["port_number"])
-            new_port.setDataLinkTypes(port["data_link_types"])
-            new_port.setStatus(self.status())
-            new_port.setAdapterType(port.get("adapter_type"))
-            new_port.setMacAddress(port.get("mac_address"))
-            self._ports.append(new_port)
+        old_ports = {(old_port.adapterNumber(), old_port.portNumber()): old_port for old_port in self._ports}
+        self._ports = [self._makePort(port, old_ports) for port in ports]
+
+        for old_port in old_ports.values():
+            if not old_port.isFree():
+                log.warning("%s: port %s has been removed while still connected", self.name(), old_port.name())
+
+    def _makePort(self, port, old_ports):
+        """
+        Creates a port or updates an existing one.
+
+        :param port: port info (dictionary)
+        :param old_ports: existing ports indexed by (adapter number, port number), a reused port is removed from it
+
+        :returns: Port instance
+        """
+
+        # Update port if it already exists
+        new_port = old_ports.pop((port["adapter_number"], port["port_number"]), None)
+        if new_port is not None:
+            new_port.setName(port["name"])
+        else:
+            if port["link_type"] == "serial":
+                new_port = SerialPort(port["name"])
+            else:
+                new_port = EthernetPort(port["name"])
+        new_port.setShortName(port["short_name"])
+        new_port.setAdapterNumber(port["adapter_number"])
+        new_port.setPortNumber(port["port_number"])
+        new_port.setDataLinkTypes(port["data_link_types"])
+        new_port.setStatus(self.status())
+        new_port.setAdapterType(port.get("adapter_type"))
+        new_port.setMacAddress(port.get("mac_address"))
+        return new_port
 
     def setGraphics(self, node_item):
         """
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import string
+
 import logging
 log = logging.getLogger(__name__)
 
@@ -27,15 +29,16 @@ class StandardPortNameFactory:
     def __new__(cls, ethernet_adapters, first_port_name, port_name_format, port_segment_size):
         ports = []
         adapter_number = interface_number = segment_number = 0
+        format_port_name = None
 
         for adapter_number in range(adapter_number, ethernet_adapters + adapter_number):
             if first_port_name and adapter_number == 0:
                 port_name = first_port_name
             else:
-                port_name = port_name_format.format(interface_number,
-                                                    segment_number,
-                                                    adapter=adapter_number,
-                                                    **cls._generate_replacement(interface_number, segment_number))
+                if format_port_name is None:
+                    # only parse the format when a port name is generated from it
+                    format_port_name = cls._compile_format(port_name_format)
+                port_name = format_port_name(interface_number, segment_number, adapter_number)
                 interface_number += 1
                 if port_segment_size:
                     if interface_number % port_segment_size == 0:
@@ -46,6 +49,40 @@ class StandardPortNameFactory:
             ports.append(port_name)
         return ports
 
+    @classmethod
+    def _compile_format(cls, port_name_format):
+        """
+        Parses the port name format once and returns a function
+        generating a port name from the interface, segment and adapter numbers.
+
+        Formats using only positional fields (e.g. "Ethernet{0}") skip
+        the generation of the keyword replacements.
+        """
+
+        if not cls._has_named_fields(port_name_format):
+            return lambda interface_number, segment_number, adapter_number: port_name_format.format(interface_number, segment_number)
+
+        def format_port_name(interface_number, segment_number, adapter_number):
+            return port_name_format.format(interface_number,
+                                           segment_number,
+                                           adapter=adapter_number,
+                                           **cls._generate_replacement(interface_number, segment_number))
+        return format_port_name
+
+    @classmethod
+    def _has_named_fields(cls, port_name_format):
+        """
+        Checks if the format uses named fields, including
+        the ones nested in a format spec (e.g. "e{0:>{port1}}").
+        """
+
+        for _, field_name, format_spec, _ in string.Formatter().parse(port_name_format):
+            if field_name and not field_name[0].isdigit():
+                return True
+            if format_spec and cls._has_named_fields(format_spec):
+                return True
+        return False
+
     @staticmethod
     def _generate_replacement(interface_number, segment_number):
         """
@@ -45,3 +45,32 @@ def test_update(virtualbox_vm):
 
         # Callback
         args[1]({"name": "VBOX2"})
+
+
+def test_configPage(virtualbox_vm):
+
+    from gns3.modules.virtualbox.pages.virtualbox_vm_configuration_page import VirtualBoxVMConfigurationPage
+    assert virtualbox_vm.configPage() is VirtualBoxVMConfigurationPage
+    assert virtualbox_vm.configPage() is VirtualBoxVMConfigurationPage
+
+
+def test_info(virtualbox_vm):
+
+    virtualbox_vm._settings.update({"console_type": "none", "usage": ""})
+    free_port = Mock(isFree=Mock(return_value=True))
+    free_port.name.return_value = "Ethernet0"
+    connected_port = Mock(isFree=Mock(return_value=False), description=Mock(return_value="connected to PC1 on port Ethernet0"))
+    connected_port.name.return_value = "Ethernet1"
+    virtualbox_vm._ports = [free_port, connected_port]
+
+    info = virtualbox_vm.info()
+    assert info.startswith("VirtualBox VM VBOX1 is stopped\n")
+    assert 'VirtualBox\'s name is "VBOX1"\n  Amount of memory is 0MB\n  Console is on port None and type is none\n' in info
+    assert "     Ethernet0 is empty\n     Ethernet1 connected to PC1 on port Ethernet0\n" in info
+
+
+def test_static_info(virtualbox_vm):
+
+    assert VirtualBoxVM.defaultSymbol() == ":/symbols/vbox_guest.svg"
+    assert VirtualBoxVM.categories() == [BaseNode.end_devices]
+    assert str(virtualbox_vm) == "VirtualBox VM"
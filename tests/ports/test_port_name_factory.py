@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2018 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from gns3.ports.port_name_factory import StandardPortNameFactory
+
+
+def test_standard_port_name_factory():
+
+    assert StandardPortNameFactory(3, None, "Ethernet{0}", 0) == ["Ethernet0", "Ethernet1", "Ethernet2"]
+
+
+def test_standard_port_name_factory_first_port_name():
+
+    assert StandardPortNameFactory(3, "mgmt0", "Ethernet{0}", 0) == ["mgmt0", "Ethernet0", "Ethernet1"]
+
+
+def test_standard_port_name_factory_with_segments():
+
+    ports = StandardPortNameFactory(5, None, "eth{segment1}/{port1}", 2)
+    assert ports == ["eth1/1", "eth1/2", "eth2/1", "eth2/2", "eth3/1"]
+
+
+def test_standard_port_name_factory_adapter_replacement():
+
+    assert StandardPortNameFactory(2, None, "{adapter}-{1}", 0) == ["0-0", "1-1"]
+
+
+def test_standard_port_name_factory_nested_named_field():
+
+    assert StandardPortNameFactory(2, None, "e{0:>{port1}}", 0) == ["e0", "e 1"]
+
+
+def test_standard_port_name_factory_unused_format():
+
+    assert StandardPortNameFactory(1, "mgmt0", "Ethernet{", 0) == ["mgmt0"]
+    assert StandardPortNameFactory(0, None, "Ethernet{", 0) == []
+
+
+def test_standard_port_name_factory_invalid_format():
+
+    with pytest.raises(ValueError):
+        StandardPortNameFactory(2, None, "Ethernet{", 0)
+    with pytest.raises(KeyError):
+        StandardPortNameFactory(2, None, "Ethernet{unknown}", 0)
+    with pytest.raises(IndexError):
+        StandardPortNameFactory(2, None, "Ethernet{2}", 0)
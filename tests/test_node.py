@@ -143,6 +143,55 @@ def test_updatePorts_PortChange(vpcs_device):
     assert port.status() == Port.started
 
 
+def test_updatePorts_AdaptersChange(vpcs_device):
+    """
+    Adding or removing adapters keeps the unchanged ports
+    """
+
+    def ports(count):
+        return [{
+            "name": "Ethernet{}".format(adapter_number),
+            "short_name": "e{}".format(adapter_number),
+            "data_link_types": {"Ethernet": "DLT_EN10MB"},
+            "port_number": 0,
+            "adapter_number": adapter_number,
+            "link_type": "ethernet"
+        } for adapter_number in range(count)]
+
+    vpcs_device._updatePorts(ports(2))
+    old_ports = list(vpcs_device._ports)
+
+    vpcs_device._updatePorts(ports(3))
+    assert len(vpcs_device._ports) == 3
+    assert vpcs_device._ports[:2] == old_ports
+
+    vpcs_device._updatePorts(ports(1))
+    assert vpcs_device._ports == old_ports[:1]
+
+
+def test_updatePorts_RemoveConnectedPort(vpcs_device):
+    """
+    Removing a port still connected to a link logs a warning
+    """
+
+    def port(adapter_number):
+        return {
+            "name": "Ethernet{}".format(adapter_number),
+            "short_name": "e{}".format(adapter_number),
+            "data_link_types": {"Ethernet": "DLT_EN10MB"},
+            "port_number": 0,
+            "adapter_number": adapter_number,
+            "link_type": "ethernet"
+        }
+
+    vpcs_device._updatePorts([port(0), port(1), port(2)])
+    vpcs_device._ports[1].isFree = MagicMock(return_value=False)
+
+    with patch('gns3.node.log.warning') as mock:
+        vpcs_device._updatePorts([port(0)])
+        mock.assert_called_once_with("%s: port %s has been removed while still connected", vpcs_device.name(), "Ethernet1")
+
+
 def test_node_setGraphics(vpcs_device):
     node = MagicMock(
         pos=MagicMock(
@@ -180,4 +229,34 @@ def test_node_setGraphics(vpcs_device):
         vpcs_device.setSettingValue('label', node.label().dump())
 
         vpcs_device.setGraphics(node)
-        assert mock.call_count == 1
\ No newline at end of file
+        assert mock.call_count == 1
+
+
+def test_node_update_only_changed_settings(vpcs_device):
+
+    vpcs_device.setSettingValue('console', 2000)
+    with patch('gns3.base_node.BaseNode.controllerHttpPut') as mock:
+        vpcs_device.update({"console": 2000, "startup_script": "echo TEST", "unknown_setting": True})
+        assert mock.call_count == 1
+        args, kwargs = mock.call_args
+        assert kwargs["body"]["properties"] == {"startup_script": "echo TEST"}
+        assert "console" not in kwargs["body"]
+
+
+def test_node_update_no_changes(vpcs_device):
+
+    with patch('gns3.base_node.BaseNode.controllerHttpPut') as mock:
+        vpcs_device.update({})
+        vpcs_device.update({"name": vpcs_device.name()})
+        assert not mock.called
+        vpcs_device.update({}, force=True)
+        assert mock.call_count == 1
+
+
+def test_node_update_unknown_settings_warning_order(vpcs_device):
+
+    with patch('gns3.node.log.warning') as mock:
+        vpcs_device.update({"unknown_b": 1, "unknown_a": 2, "unknown_c": 3})
+        assert [args[0] for args, _ in mock.call_args_list] == ["'unknown_b' setting is unknown",
+                                                                "'unknown_a' setting is unknown",
+                                                                "'unknown_c' setting is unknown"]